@@ -23,7 +23,7 @@ import copy
 import random
 import hashlib
 from random import randint
-from ovs.dal.helpers import Descriptor, HybridRunner
+from ovs.dal.helpers import DalToolbox, Descriptor, HybridRunner
 from ovs.dal.exceptions import ObjectNotFoundException
 from ovs.extensions.storage.volatilefactory import VolatileFactory
 from ovs.extensions.storage.persistentfactory import PersistentFactory
@@ -133,7 +133,7 @@ class DataList(object):
             # Unsure whether or not the same query would apply
             self._volatile.delete(self._key)
         elif self._provided_key is False or reset is True:
-            identifier = copy.deepcopy(self._query)
+            identifier = dict(self._query)  # Only top-level keys are added, the query itself is left untouched
             identifier['object'] = self._object_type.__name__
             # Order matters so keeping order in cache too
             identifier['guids'] = 'None' if self._provided_guids is None else ','.join(self._provided_guids)
@@ -273,7 +273,7 @@ class DataList(object):
                         if item[0] == 'guid':
                             indexed_keys = {object_key.format(item[2])}
                         else:
-                            index_key = base_index_prefix.format(item[0], hashlib.sha1(str(item[2])).hexdigest())
+                            index_key = base_index_prefix.format(item[0], DalToolbox.get_value_hash(item[2]))
                             # [item for sublist in mainlist for item in sublist] - shitty nested list comprehensions
                             indexed_keys = set(str(key)
                                                for keys_set in self._persistent.get_multi([index_key], must_exist=False)
@@ -292,7 +292,7 @@ class DataList(object):
                         if item[0] == 'guid':
                             indexed_keys = set(object_key.format(sub_item) for sub_item in item[2])
                         else:
-                            index_keys = [base_index_prefix.format(item[0], hashlib.sha1(str(sub_item)).hexdigest())
+                            index_keys = [base_index_prefix.format(item[0], DalToolbox.get_value_hash(sub_item))
                                           for sub_item in item[2]]
                             # [item for sublist in mainlist for item in sublist] - shitty nested list comprehensions
                             indexed_keys = set(str(key)
@@ -349,7 +349,7 @@ class DataList(object):
                 # Build and cache the keys
                 self._provided_keys = ['{0}{1}'.format(prefix, guid) for guid in self._provided_guids]
 
-        indexed_properties = [prop.name for prop in self._object_type._properties if prop.indexed is True] + ['guid']
+        indexed_properties = self._object_type._indexed_property_names + ('guid',)
         use_indexes = self._can_use_indexes(indexed_properties, query_items, query_type)
         if use_indexes is True:
             keys = self._get_keys_from_index(indexed_properties, query_items, query_type)
@@ -485,10 +485,7 @@ class DataList(object):
         """
         from ovs.dal.dataobject import DataObject
 
-        hybrid_structure = HybridRunner.get_hybrids()
-        query_object_id = Descriptor(self._object_type).descriptor['identifier']
-        if query_object_id in hybrid_structure and query_object_id != hybrid_structure[query_object_id]['identifier']:
-            self._object_type = Descriptor().load(hybrid_structure[query_object_id]).get_object()
+        self._object_type = HybridRunner.get_hybrid(self._object_type)
         object_type_name = self._object_type.__name__.lower()
         prefix = '{0}_{1}_'.format(DataObject.NAMESPACE, object_type_name)
 
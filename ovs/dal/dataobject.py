@@ -22,9 +22,7 @@ import copy
 import time
 import json
 import logging
-import inspect
-import hashlib
-from random import randint
+from random import uniform
 from ovs.dal.exceptions import (ObjectNotFoundException, ConcurrencyException, LinkedObjectException,
                                 MissingMandatoryFieldsException, RaceConditionException, InvalidRelationException,
                                 VolatileObjectException, UniqueConstraintViolationException)
@@ -40,7 +38,8 @@ from ovs.extensions.storage.volatilefactory import VolatileFactory
 
 class MetaClass(type):
     """
-    This metaclass provides dynamic __doc__ generation feeding doc generators
+    This metaclass installs the properties, relations and dynamics on the hybrid classes and provides
+    dynamic __doc__ generation feeding doc generators
     """
 
     # noinspection PyInitNewSignature
@@ -58,6 +57,22 @@ class MetaClass(type):
                 if '_{0}_{1}'.format(name, internal) in dct:  # instance._Testobject__properties. __properties cannot get overruled by inheritance
                     data.update(dct.pop('_{0}_{1}'.format(name, internal)))
                 dct[internal] = list(data)
+            dct['_indexed_properties'] = tuple(prop for prop in dct['_properties'] if prop.indexed is True)
+            dct['_indexed_property_names'] = tuple(prop.name for prop in dct['_indexed_properties'])
+            dct['_unique_properties'] = tuple(prop for prop in dct['_properties'] if prop.unique is True)
+            dct['_relation_names'] = frozenset(relation.name for relation in dct['_relations'])
+            dct['_properties_by_name'] = dict((prop.name, prop) for prop in dct['_properties'])
+            dct['_attribute_names'] = frozenset([prop.name for prop in dct['_properties']] +
+                                                [relation.name for relation in dct['_relations']] +
+                                                [dynamic.name for dynamic in dct['_dynamics']])
+            # Key generation
+            classname = name.lower()
+            dct['_classname'] = classname
+            dct['_key_prefix'] = '{0}_{1}_'.format(DataObject.NAMESPACE, classname)
+            dct['_index_key_prefixes'] = dict((prop.name, 'ovs_index_{0}|{1}|'.format(classname, prop.name))
+                                              for prop in dct['_properties'] if prop.indexed is True)
+            dct['_unique_key_prefixes'] = dict((prop.name, 'ovs_unique_{0}_{1}_'.format(classname, prop.name))
+                                               for prop in dct['_properties'] if prop.unique is True)
             # Doc generation - properties
             for prop in dct['_properties']:
                 docstring = prop.docstring
@@ -67,14 +82,14 @@ class MetaClass(type):
                 else:
                     itemtype = 'Enum({0})'.format(prop.property_type[0].__class__.__name__)
                     extra_info = '(enum values: {0})'.format(', '.join(prop.property_type))
-                dct[prop.name] = property(
-                    doc='[persistent] {0} {1}\n@type: {2}'.format(docstring, extra_info, itemtype)
+                dct[prop.name] = MetaClass._build_property(
+                    prop, '[persistent] {0} {1}\n@type: {2}'.format(docstring, extra_info, itemtype)
                 )
             # Doc generation - relations
             for relation in dct['_relations']:
                 itemtype = relation.foreign_type.__name__ if relation.foreign_type is not None else name
-                dct[relation.name] = property(
-                    doc='[relation] one-to-{0} relation with {1}.{2}\n@type: {3}'.format(
+                dct[relation.name], dct['{0}_guid'.format(relation.name)] = MetaClass._build_relation_properties(
+                    relation, '[relation] one-to-{0} relation with {1}.{2}\n@type: {3}'.format(
                         'one' if relation.onetoone else 'many',
                         itemtype,
                         relation.foreign_key,
@@ -99,13 +114,48 @@ class MetaClass(type):
                 else:
                     itemtype = 'Enum({0})'.format(dynamic.return_type[0].__class__.__name__)
                     extra_info = '(enum values: {0})'.format(', '.join(dynamic.return_type))
-                dct[dynamic.name] = property(
-                    fget=method,
-                    doc='[dynamic] ({0}s) {1} {2}\n@rtype: {3}'.format(dynamic.timeout, docstring, extra_info, itemtype)
+                dct[dynamic.name] = MetaClass._build_dynamic_property(
+                    dynamic, '[dynamic] ({0}s) {1} {2}\n@rtype: {3}'.format(dynamic.timeout, docstring, extra_info, itemtype)
                 )
 
         return super(MetaClass, mcs).__new__(mcs, name, bases, dct)
 
+    @staticmethod
+    def _build_property(prop, doc):
+        """
+        Builds the class property for a simple property
+        """
+        # pylint: disable=protected-access
+        name = prop.name  # Bound once, so a read is a single dict lookup
+        fget = lambda s: s._data[name]
+        fset = lambda s, v: s._set_property(prop, v)
+        # pylint: enable=protected-access
+        return property(fget, fset, doc=doc)
+
+    @staticmethod
+    def _build_relation_properties(relation, doc):
+        """
+        Builds the class properties for a complex property (hybrids) and its guid
+        """
+        # pylint: disable=protected-access
+        name = relation.name
+        fget = lambda s: s._get_relation_property(relation)
+        fset = lambda s, v: s._set_relation_property(relation, v)
+        gget = lambda s: s._data[name]['guid']
+        # pylint: enable=protected-access
+        return property(fget, fset, doc=doc), property(gget)
+
+    @staticmethod
+    def _build_dynamic_property(dynamic, doc):
+        """
+        Builds the class property for a dynamic property
+        """
+        # pylint: disable=protected-access
+        method_name = '_{0}'.format(dynamic.name)  # Resolved on the instance, as extended hybrids can override it
+        fget = lambda s: s._backend_property(getattr(s, method_name), dynamic)
+        # pylint: enable=protected-access
+        return property(fget, doc=doc)
+
 
 class DataObjectAttributeEncoder(json.JSONEncoder):
     """
@@ -147,9 +197,28 @@ class DataObject(object):
     _properties = []  # Blueprint data of the object type
     _dynamics = []    # Timeout of readonly object properties cache
     _relations = []   # Blueprint for relations
+    _indexed_properties = ()  # Indexed properties, filled in by the metaclass
+    _indexed_property_names = ()  # Names of the indexed properties, filled in by the metaclass
+    _unique_properties = ()  # Properties with a unique constraint, filled in by the metaclass
+    _relation_names = frozenset()  # Names of the relations, filled in by the metaclass
+    _properties_by_name = {}  # Properties by their name, filled in by the metaclass
+    _attribute_names = frozenset()  # Names of the properties, relations and dynamics, filled in by the metaclass
+    _classname = None  # Lowercase class name, filled in by the metaclass
+    _key_prefix = None  # Prefix of the object keys, filled in by the metaclass
+    _index_key_prefixes = {}  # Index key prefix per indexed property, filled in by the metaclass
+    _unique_key_prefixes = {}  # Unique key prefix per unique property, filled in by the metaclass
+    _foreign_classes = {}  # (Extended) hybrid class per relation, filled in on first instantiation
+    _foreign_relations = {}  # Relations pointing towards this class, filled in on first instantiation
+    _reverse_index_key_templates = {}  # Reverse index key template per relation, filled in on first instantiation
+    _immutable_types = (basestring, int, long, float, bool, type(None))  # Values that can be shared between data copies
     _logger = logging.getLogger(__name__)
 
     NAMESPACE = 'ovs_data'  # Arakoon namespace
+    STR_ENCODER = DataObjectAttributeEncoder(indent=4)  # Encoders are stateless, so one instance can be shared
+    MAX_TRIES = 5  # Attempts to save or delete an object when it's concurrently modified
+    BACKOFF_BASE = 0.02  # Initial upper bound (in seconds) of the randomized wait between attempts
+    BACKOFF_CAP = 1.0  # Maximum upper bound (in seconds) of the randomized wait between attempts
+    TIME_DYNAMICS = True  # Keep track of how long loading each dynamic takes (see get_timings, reported by the API)
 
     ###############
     # Constructor #
@@ -159,10 +228,8 @@ class DataObject(object):
         """
         Control the initialization of the class
         """
-        hybrid_structure = HybridRunner.get_hybrids()
-        identifier = Descriptor(cls).descriptor['identifier']
-        if identifier in hybrid_structure and identifier != hybrid_structure[identifier]['identifier']:
-            new_class = Descriptor().load(hybrid_structure[identifier]).get_object()  # Load the possible extended hybrid
+        new_class = HybridRunner.get_hybrid(cls)  # Load the possible extended hybrid
+        if new_class is not cls:
             # noinspection PyArgumentList
             return super(cls, new_class).__new__(new_class, *args)
         return super(DataObject, cls).__new__(cls)
@@ -188,23 +255,37 @@ class DataObject(object):
         self._metadata = {}  # Some metadata, mainly used for unit testing
         self._data = {}      # Internal data storage
         self._objects = {}   # Internal objects storage
-        self._dynamic_timings = {}
+        self._dynamic_timings = None  # Only allocated when dynamics are timed
 
         # Initialize public fields
         self.dirty = False
         self.volatile = volatile
 
-        # Worker fields/objects
-        self._classname = self.__class__.__name__.lower()
-
-        # Rebuild _relation types
-        hybrid_structure = HybridRunner.get_hybrids()
-        for relation in self._relations:
-            if relation.foreign_type is not None:  # If none -> points to itself
-                identifier = Descriptor(relation.foreign_type).descriptor['identifier']
-                if identifier in hybrid_structure and identifier != hybrid_structure[identifier]['identifier']:
+        # Rebuild _relation types, once per class. Everything is built and installed before _relation_descriptors
+        # is set, as that marks the class as done: a concurrent first instantiation either redoes this (idempotent)
+        # work, or sees a fully initialized class
+        if '_relation_descriptors' not in self.__class__.__dict__:
+            foreign_classes = {}
+            for relation in self._relations:
+                if relation.foreign_type is None:  # If none -> points to itself
+                    foreign_classes[relation.name] = self.__class__
+                else:
                     # Point to relations of the original object when object got extended
-                    relation.foreign_type = Descriptor().load(hybrid_structure[identifier]).get_object()
+                    relation.foreign_type = HybridRunner.get_hybrid(relation.foreign_type)
+                    foreign_classes[relation.name] = relation.foreign_type
+            self.__class__._foreign_classes = foreign_classes
+            # Only the foreign guid and own guid remain to be filled in into the reverse index keys
+            reverse_index_key_templates = {}
+            for relation in self._relations:
+                classname = foreign_classes[relation.name]._classname
+                reverse_index_key_templates[relation.name] = 'ovs_reverseindex_{0}_{{0}}|{1}|{{1}}'.format(classname, relation.foreign_key)
+            self.__class__._reverse_index_key_templates = reverse_index_key_templates
+            # Foreign relations (to many side of things) are only known once the hybrids are loaded
+            foreign_relations = RelationMapper.load_foreign_relations(self.__class__) or {}
+            for key, info in foreign_relations.iteritems():
+                self._add_list_property(key, info['list'])
+            self.__class__._foreign_relations = foreign_relations
+            self.__class__._relation_descriptors = {}  # Empty relation descriptors, built on first use. Must be set last
         # Init guid
         self._new = False
         if guid is None:
@@ -214,7 +295,7 @@ class DataObject(object):
             self._guid = str(guid)
 
         # Build base keys
-        self._key = '{0}_{1}_{2}'.format(DataObject.NAMESPACE, self._classname, self._guid)
+        self._key = self._key_prefix + self._guid
 
         # Worker mutexes
         self._mutex_version = volatile_mutex('ovs_dataversion_{0}_{1}'.format(self._classname, self._guid))
@@ -225,8 +306,7 @@ class DataObject(object):
         self._metadata['cache'] = None
         if not self._new:
             if data is not None:
-                self._data = copy.deepcopy(data)
-                self._metadata['cache'] = None
+                self._data = self._copy_data(data)
             else:
                 self._data = self._volatile.get(self._key)
                 if self._data is None:
@@ -244,29 +324,20 @@ class DataObject(object):
         for prop in self._properties:
             if prop.name not in self._data:
                 self._data[prop.name] = prop.default
-            self._add_property(prop)
 
         # Load relations
         for relation in self._relations:
             if relation.name not in self._data:
-                if relation.foreign_type is None:
-                    cls = self.__class__
-                else:
-                    cls = relation.foreign_type
-                self._data[relation.name] = Descriptor(cls).descriptor
-            self._add_relation_property(relation)
-
-        # Add wrapped properties
-        for dynamic in self._dynamics:
-            self._add_dynamic_property(dynamic)
+                descriptor = self._relation_descriptors.get(relation.name)
+                if descriptor is None:
+                    descriptor = Descriptor(self._foreign_classes[relation.name]).descriptor
+                    self._relation_descriptors[relation.name] = descriptor
+                self._data[relation.name] = dict(descriptor)  # A descriptor is flat, a shallow copy will do
 
         # Load foreign keys
-        relations = RelationMapper.load_foreign_relations(self.__class__)  # To many side of things
-        if relations is not None:
-            for key, info in relations.iteritems():
-                self._objects[key] = {'info': info,
-                                      'data': None}
-                self._add_list_property(key, info['list'])
+        for key, info in self._foreign_relations.iteritems():
+            self._objects[key] = {'info': info,
+                                  'data': None}
 
         if _hook is not None and 'before_cache' in _hook:
             _hook['before_cache']()
@@ -275,8 +346,10 @@ class DataObject(object):
             # Re-cache the object, if required
             if self._metadata['cache'] is False:
                 # The data wasn't loaded from the cache, so caching is required now
+                acquired = False
                 try:
                     self._mutex_version.acquire(30)
+                    acquired = True
                     this_version = self._data['_version']
                     if _hook is not None and 'during_cache' in _hook:
                         _hook['during_cache']()
@@ -290,73 +363,38 @@ class DataObject(object):
                 except NoLockAvailableException:
                     pass
                 finally:
-                    self._mutex_version.release()
+                    if acquired is True:
+                        self._mutex_version.release()
 
         # Freeze property creation
         self._frozen = True
 
         # Optionally, initialize some fields
         if data is not None:
-            for prop in self._properties:
-                if prop.name in data:
-                    setattr(self, prop.name, data[prop.name])
+            for name, value in data.iteritems():
+                prop = self._properties_by_name.get(name)
+                if prop is not None:
+                    self._set_property(prop, value)  # Validates straight away, no attribute dispatch needed
 
         # Store original data
-        self._original = copy.deepcopy(self._data)
+        self._original = self._copy_data(self._data)
 
     ##################################################
     # Helper methods for dynamic getting and setting #
     ##################################################
 
-    def _add_property(self, prop):
-        """
-        Adds a simple property to the object
-        """
-        # pylint: disable=protected-access
-        fget = lambda s: s._get_property(prop)
-        fset = lambda s, v: s._set_property(prop, v)
-        # pylint: enable=protected-access
-        setattr(self.__class__, prop.name, property(fget, fset))
-
-    def _add_relation_property(self, relation):
-        """
-        Adds a complex property to the object (hybrids)
-        """
-        # pylint: disable=protected-access
-        fget = lambda s: s._get_relation_property(relation)
-        fset = lambda s, v: s._set_relation_property(relation, v)
-        gget = lambda s: s._get_guid_property(relation)
-        # pylint: enable=protected-access
-        setattr(self.__class__, relation.name, property(fget, fset))
-        setattr(self.__class__, '{0}_guid'.format(relation.name), property(gget))
-
     def _add_list_property(self, attribute, islist):
         """
         Adds a list (readonly) property to the object
         """
         # pylint: disable=protected-access
         fget = lambda s: s._get_list_property(attribute)
-        gget = lambda s: s._get_list_guid_property(attribute)
+        gget = lambda s: s._get_list_guid_property(attribute, islist)
         # pylint: enable=protected-access
         setattr(self.__class__, attribute, property(fget))
         setattr(self.__class__, ('{0}_guids' if islist else '{0}_guid').format(attribute), property(gget))
 
-    def _add_dynamic_property(self, dynamic):
-        """
-        Adds a dynamic property to the object
-        """
-        # pylint: disable=protected-access
-        fget = lambda s: s._get_dynamic_property(dynamic)
-        # pylint: enable=protected-access
-        setattr(self.__class__, dynamic.name, property(fget))
-
     # Helper method supporting property fetching
-    def _get_property(self, prop):
-        """
-        Getter for a simple property
-        """
-        return self._data[prop.name]
-
     def _get_relation_property(self, relation):
         """
         Getter for a complex property (hybrid)
@@ -364,17 +402,14 @@ class DataObject(object):
         """
         attribute = relation.name
         if attribute not in self._objects:
-            descriptor = Descriptor().load(self._data[attribute])
-            self._objects[attribute] = descriptor.get_object(instantiate=True)
+            guid = self._data[attribute]['guid']
+            if guid is None:
+                self._objects[attribute] = None
+            else:
+                # The relation's class is known, there is no need to resolve it from the stored descriptor
+                self._objects[attribute] = self._foreign_classes[attribute](guid)
         return self._objects[attribute]
 
-    def _get_guid_property(self, relation):
-        """
-        Getter for a foreign key property
-        """
-        attribute = relation.name
-        return self._data[attribute]['guid']
-
     def _get_list_property(self, attribute):
         """
         Getter for the list property
@@ -383,7 +418,7 @@ class DataObject(object):
         preserving as much already loaded objects as possible
         """
         info = self._objects[attribute]['info']
-        remote_class = Descriptor().load(info['class']).get_object()
+        remote_class = Descriptor.load_class(info['class'])
         remote_key = info['key']  # Foreign = remote
         datalist = DataList.get_relation_set(remote_class, remote_key, self.__class__, attribute, self.guid)
         if self._objects[attribute]['data'] is None:
@@ -398,32 +433,24 @@ class DataObject(object):
                 raise InvalidRelationException('More than one element found in {0}'.format(attribute))
             return data[0] if len(data) == 1 else None
 
-    def _get_list_guid_property(self, attribute):
+    def _get_list_guid_property(self, attribute, islist):
         """
         Getter for guid list property
         """
-        list_or_item = getattr(self, attribute)
+        list_or_item = self._get_list_property(attribute)
+        if islist is True:
+            return list_or_item._guids
         if list_or_item is None:
             return None
-        if hasattr(list_or_item, '_guids'):
-            return list_or_item._guids
         return list_or_item.guid
 
-    def _get_dynamic_property(self, dynamic):
-        """
-        Getter for dynamic property, wrapping the internal data loading property
-        in a caching layer
-        """
-        data_loader = getattr(self, '_{0}'.format(dynamic.name))
-        return self._backend_property(data_loader, dynamic)
-
     # Helper method supporting property setting
     def _set_property(self, prop, value):
         """
         Setter for a simple property that will validate the type
         """
         self.dirty = True
-        if value is None:
+        if value is None or (prop.allowed_types is not None and isinstance(value, prop.allowed_types)):
             self._data[prop.name] = value
         else:
             correct, allowed_types, given_type = DalToolbox.check_type(value, prop.property_type)
@@ -459,15 +486,12 @@ class DataObject(object):
         __setattr__ hook that will block creating on the fly new properties, except
         the predefined ones
         """
-        if not hasattr(self, '_frozen') or not self._frozen:
+        if not self.__dict__.get('_frozen', False):  # Direct lookup, no attribute resolution on every assignment
             allowed = True
         else:
             # If our object structure is frozen (which is after __init__), we only allow known
             # property updates: items that are in __dict__ and our own blueprinting dicts
-            allowed = key in self.__dict__ \
-                or key in (prop.name for prop in self._properties) \
-                or key in (relation.name for relation in self._relations) \
-                or key in (dynamic.name for dynamic in self._dynamics)
+            allowed = key in self.__dict__ or key in self._attribute_names
         if allowed:
             super(DataObject, self).__setattr__(key, value)
         else:
@@ -496,7 +520,7 @@ class DataObject(object):
         last_assert = None
         while successful is False:
             tries += 1
-            if tries > 5:
+            if tries > self.MAX_TRIES:
                 DataObject._logger.error('Raising RaceConditionException. Last AssertException: {0}'.format(last_assert))
                 raise RaceConditionException()
 
@@ -511,41 +535,36 @@ class DataObject(object):
                 raise MissingMandatoryFieldsException('Missing fields on {0}: {1}'.format(self._classname, ', '.join(invalid_fields)))
 
             if recursive:
+                # Objects that were never loaded through this object can't have changes, so only loaded ones are saved
                 # Save objects that point to us (e.g. disk.vmachine - if this is disk)
                 for relation in self._relations:
                     if relation.name != skip:  # disks will be skipped
-                        item = getattr(self, relation.name)
+                        item = self._objects.get(relation.name)
                         if item is not None:
                             item.save(recursive=True, skip=relation.foreign_key)
 
                 # Save object we point at (e.g. machine.vdisks - if this is machine)
                 # @todo should be within the same transaction to avoid errors
-                relations = RelationMapper.load_foreign_relations(self.__class__)
-                if relations is not None:
-                    for key, info in relations.iteritems():
-                        if key != skip:  # machine will be skipped
-                            if info['list'] is True:
-                                for item in getattr(self, key).iterloaded():
-                                    item.save(recursive=True, skip=info['key'])
-                            else:
-                                item = getattr(self, key)
-                                if item is not None:
-                                    item.save(recursive=True, skip=info['key'])
-
+                for key, info in self._foreign_relations.iteritems():
+                    if key != skip:  # machine will be skipped
+                        items = self._objects[key]['data']
+                        if items is not None:
+                            for item in items.iterloaded():
+                                item.save(recursive=True, skip=info['key'])
+
+            # Only changed relations need validation. Deleting an object that is still linked is prevented by delete()
             validation_keys = []
             for relation in self._relations:
-                if self._data[relation.name]['guid'] is not None:
-                    if relation.foreign_type is None:
-                        cls = self.__class__
-                    else:
-                        cls = relation.foreign_type
-                    validation_keys.append('{0}_{1}_{2}'.format(DataObject.NAMESPACE, cls.__name__.lower(), self._data[relation.name]['guid']))
-            try:
-                [_ for _ in self._persistent.get_multi(validation_keys)]
-            except KeyNotFoundException:
-                raise ObjectNotFoundException('One of the relations specified in {0} with guid \'{1}\' was not found'.format(
-                    self.__class__.__name__, self._guid
-                ))
+                guid = self._data[relation.name]['guid']
+                if guid is not None and guid != self._original.get(relation.name, {}).get('guid'):
+                    validation_keys.append(self._foreign_classes[relation.name]._key_prefix + guid)
+            if len(validation_keys) > 0:
+                try:
+                    [_ for _ in self._persistent.get_multi(validation_keys)]
+                except KeyNotFoundException:
+                    raise ObjectNotFoundException('One of the relations specified in {0} with guid \'{1}\' was not found'.format(
+                        self.__class__.__name__, self._guid
+                    ))
 
             transaction = self._persistent.begin_transaction()
             if self._new is True:
@@ -553,8 +572,8 @@ class DataObject(object):
                 store_data = {'_version': 0}
             elif optimistic is True:
                 self._persistent.assert_value(self._key, self._original, transaction=transaction)
-                data = copy.deepcopy(self._original)
-                store_data = copy.deepcopy(self._original)
+                data = self._copy_data(self._original)
+                store_data = self._copy_data(self._original)
             else:
                 try:
                     current_data = self._persistent.get(self._key)
@@ -563,56 +582,66 @@ class DataObject(object):
                         self.__class__.__name__, self._guid
                     ))
                 self._persistent.assert_value(self._key, current_data, transaction=transaction)
-                data = copy.deepcopy(current_data)
-                store_data = copy.deepcopy(current_data)
+                data = self._copy_data(current_data)
+                store_data = self._copy_data(current_data)
 
             changed_fields = []
             data_conflicts = []
-            for attribute in self._data.keys():
+            own_data = self._data
+            original_data = self._original
+            for attribute, value in own_data.iteritems():
                 if attribute == '_version':
                     continue
-                if self._data[attribute] != self._original[attribute]:
+                original_value = original_data[attribute]
+                if value != original_value:
                     # We changed this value
                     changed_fields.append(attribute)
-                    if attribute in data and self._original[attribute] != data[attribute]:
+                    if attribute in data and original_value != data[attribute]:
                         # Some other process also wrote to the database
                         if self._datastore_wins is None:
                             # In case we didn't set a policy, we raise the conflicts
                             data_conflicts.append(attribute)
                         elif self._datastore_wins is False:
                             # If the data-store should not win, we just overwrite the data
-                            data[attribute] = self._data[attribute]
+                            data[attribute] = value
                         # If the data-store should win, we discard/ignore our change
                     else:
                         # Normal scenario, saving data
-                        data[attribute] = self._data[attribute]
+                        data[attribute] = value
                 elif attribute not in data:
-                    data[attribute] = self._data[attribute]
-            for attribute in data.keys():
-                if attribute == '_version':
-                    continue
-                if attribute not in self._data:
-                    del data[attribute]
+                    data[attribute] = value
+            for attribute in [attribute for attribute in data if attribute != '_version' and attribute not in own_data]:
+                del data[attribute]
             if data_conflicts:
                 raise ConcurrencyException('Got field conflicts while saving {0}. Conflicts: {1}'.format(
                     self._classname, ', '.join(data_conflicts)
                 ))
 
             # Refresh internal data structure
-            self._data = copy.deepcopy(data)
+            self._data = self._copy_data(data)
 
             # Update indexes
-            base_index_key = 'ovs_index_{0}|{1}|{2}'
-            for prop in self._properties:
-                if prop.indexed is True:
-                    if prop.property_type not in [str, int, float, long, bool]:
-                        raise RuntimeError('An index can only be set on field of type str, int, float, long, or bool')
-                    classname = self.__class__.__name__.lower()
-                    key = prop.name
-                    if self._new is False and key in changed_fields:
-                        original_value = self._original[key]
-                        index_key = base_index_key.format(classname, key, hashlib.sha1(str(original_value)).hexdigest())
-                        indexed_keys = list(self._persistent.get_multi([index_key], must_exist=False))[0]
+            index_changes = []
+            for prop in self._indexed_properties:
+                if prop.property_type not in [str, int, float, long, bool]:
+                    raise RuntimeError('An index can only be set on field of type str, int, float, long, or bool')
+                key = prop.name
+                index_key_prefix = self._index_key_prefixes[key]
+                if self._new is False and key in changed_fields:
+                    original_value = self._original[key]
+                    index_changes.append((index_key_prefix + DalToolbox.get_value_hash(original_value), False))
+                if self._new is True or key in changed_fields:
+                    new_value = self._data[key]
+                    index_changes.append((index_key_prefix + DalToolbox.get_value_hash(new_value), True))
+            if len(index_changes) > 0:
+                # All indexes are fetched at once, instead of one round-trip per index
+                index_keys = [index_key for index_key, _ in index_changes]
+                indexes = dict(zip(index_keys, self._persistent.get_multi(index_keys, must_exist=False)))
+                for index_key, add in index_changes:
+                    indexed_keys = indexes[index_key]
+                    if indexed_keys is not None:
+                        indexed_keys = indexed_keys[:]  # The same index can be updated more than once
+                    if add is False:
                         if indexed_keys is None:
                             self._persistent.assert_value(index_key, None, transaction=transaction)
                         elif self._key in indexed_keys:
@@ -622,10 +651,7 @@ class DataObject(object):
                                 self._persistent.delete(index_key, transaction=transaction)
                             else:
                                 self._persistent.set(index_key, indexed_keys, transaction=transaction)
-                    if self._new is True or key in changed_fields:
-                        new_value = self._data[key]
-                        index_key = base_index_key.format(classname, key, hashlib.sha1(str(new_value)).hexdigest())
-                        indexed_keys = list(self._persistent.get_multi([index_key], must_exist=False))[0]
+                    else:
                         if indexed_keys is None:
                             self._persistent.assert_value(index_key, None, transaction=transaction)
                             self._persistent.set(index_key, [self._key], transaction=transaction)
@@ -635,53 +661,51 @@ class DataObject(object):
                             self._persistent.set(index_key, indexed_keys, transaction=transaction)
 
             # Update reverse index
-            base_reverse_key = 'ovs_reverseindex_{0}_{1}|{2}|{3}'
             for relation in self._relations:
                 key = relation.name
                 original_guid = self._original[key]['guid']
                 new_guid = self._data[key]['guid']
                 if original_guid != new_guid:
-                    if relation.foreign_type is None:
-                        classname = self.__class__.__name__.lower()
-                    else:
-                        classname = relation.foreign_type.__name__.lower()
+                    reverse_key_template = self._reverse_index_key_templates[key]
                     if original_guid is not None:
-                        reverse_key = base_reverse_key.format(classname, original_guid, relation.foreign_key, self.guid)
+                        reverse_key = reverse_key_template.format(original_guid, self._guid)
                         self._persistent.delete(reverse_key, must_exist=False, transaction=transaction)
                     if new_guid is not None:
-                        reverse_key = base_reverse_key.format(classname, new_guid, relation.foreign_key, self.guid)
-                        self._persistent.assert_exists('{0}_{1}_{2}'.format(DataObject.NAMESPACE, classname, new_guid))
+                        reverse_key = reverse_key_template.format(new_guid, self._guid)
+                        # Existence was validated upfront, asserting it in the transaction covers a concurrent delete
+                        self._persistent.assert_exists(self._foreign_classes[key]._key_prefix + new_guid, transaction=transaction)
                         self._persistent.set(reverse_key, 0, transaction=transaction)
 
-            # Invalidate property lists
-            persistent_cache_key = DataList.generate_persistent_cache_key(self._classname)
-            cache_keys = set()
-            for key in list(self._persistent.prefix(persistent_cache_key)):
-                _, field, cache_key = DataList.get_key_parts(key)
-                if field in changed_fields or self._new is True:
-                    cache_keys.add(cache_key)
-            for cache_key in cache_keys:
-                self._volatile.delete(cache_key)
-            if self._new:
-                # New item. All lists need to be removed
-                self._persistent.delete_prefix(persistent_cache_key, transaction=transaction)
-            else:
-                for field in changed_fields:
-                    self._persistent.delete_prefix(DataList.generate_persistent_cache_key(self._classname, field), transaction=transaction)
+            # Invalidate property lists. Without changes, no list can be outdated
+            if self._new is True or len(changed_fields) > 0:
+                if self._new:
+                    # New item. All lists need to be removed
+                    persistent_cache_keys = [DataList.generate_persistent_cache_key(self._classname)]
+                else:
+                    # Only the lists depending on a changed field are scanned, the backend filters on the prefix
+                    persistent_cache_keys = [DataList.generate_persistent_cache_key(self._classname, field) + '|'
+                                             for field in changed_fields]
+                cache_keys = set()
+                for persistent_cache_key in persistent_cache_keys:
+                    for key in self._persistent.prefix(persistent_cache_key):
+                        cache_keys.add(DataList.extract_cache_key(key))
+                    self._persistent.delete_prefix(persistent_cache_key, transaction=transaction)
+                for cache_key in cache_keys:
+                    self._volatile.delete(cache_key)
 
             # Validate unique constraints
-            unique_key = 'ovs_unique_{0}_{{0}}_{{1}}'.format(self._classname)
-            for prop in self._properties:
-                if prop.unique is True:
-                    if prop.property_type not in [str, int, float, long]:
-                        raise RuntimeError('A unique constraint can only be set on field of type str, int, float, or long')
-                    if self._new is False and prop.name in changed_fields:
-                        key = unique_key.format(prop.name, hashlib.sha1(str(store_data[prop.name])).hexdigest())
-                        self._persistent.assert_value(key, self._key, transaction=transaction)
-                        self._persistent.delete(key, transaction=transaction)
-                    key = unique_key.format(prop.name, hashlib.sha1(str(self._data[prop.name])).hexdigest())
-                    if self._new is True or prop.name in changed_fields:
-                        self._persistent.assert_value(key, None, transaction=transaction)
+            for prop in self._unique_properties:
+                if prop.property_type not in [str, int, float, long]:
+                    raise RuntimeError('A unique constraint can only be set on field of type str, int, float, or long')
+                unique_key_prefix = self._unique_key_prefixes[prop.name]
+                if self._new is False and prop.name in changed_fields:
+                    key = unique_key_prefix + DalToolbox.get_value_hash(store_data[prop.name])
+                    self._persistent.assert_value(key, self._key, transaction=transaction)
+                    self._persistent.delete(key, transaction=transaction)
+                if self._new is True or prop.name in changed_fields:
+                    # An unchanged value already has its constraint pointing to this object
+                    key = unique_key_prefix + DalToolbox.get_value_hash(self._data[prop.name])
+                    self._persistent.assert_value(key, None, transaction=transaction)
                     self._persistent.set(key, self._key, transaction=transaction)
 
             if _hook is not None:
@@ -689,8 +713,10 @@ class DataObject(object):
 
             # Save the data
             self._data['_version'] += 1
+            acquired = False
             try:
                 self._mutex_version.acquire(30)
+                acquired = True
                 self._persistent.set(self._key, self._data, transaction=transaction)
                 self._persistent.apply_transaction(transaction)
                 self._volatile.delete(self._key)
@@ -713,12 +739,14 @@ class DataObject(object):
                 last_assert = ex
                 optimistic = False
                 self._mutex_version.release()  # Make sure it's released before a sleep
-                time.sleep(randint(0, 25) / 100.0)
+                acquired = False
+                self._backoff(tries)
             finally:
-                self._mutex_version.release()
+                if acquired is True:
+                    self._mutex_version.release()
 
         self.invalidate_dynamics()
-        self._original = copy.deepcopy(self._data)
+        self._original = self._copy_data(self._data)
 
         self.dirty = False
         self._new = False
@@ -736,46 +764,45 @@ class DataObject(object):
         if self.volatile is True:
             raise VolatileObjectException()
 
+        relations = self._foreign_relations  # Resolved once per class, so invariant over the retries
         tries = 0
         successful = False
         optimistic = True
         last_assert = None
         while successful is False:
             tries += 1
-            if tries > 5:
+            if tries > self.MAX_TRIES:
                 DataObject._logger.error('Raising RaceConditionException. Last AssertException: {0}'.format(last_assert))
                 raise RaceConditionException()
 
             transaction = self._persistent.begin_transaction()
 
             # Check foreign relations
-            relations = RelationMapper.load_foreign_relations(self.__class__)
-            if relations is not None:
-                for key, info in relations.iteritems():
-                    items = getattr(self, key)
-                    if info['list'] is True:
-                        if len(items) > 0:
-                            if abandon is not None and (key in abandon or '_all' in abandon):
-                                for item in items.itersafe():
-                                    setattr(item, info['key'], None)
-                                    try:
-                                        item.save()
-                                    except ObjectNotFoundException:
-                                        pass
-                            else:
-                                multi = 'are {0} items'.format(len(items)) if len(items) > 1 else 'is 1 item'
-                                raise LinkedObjectException('There {0} left in self.{1}'.format(multi, key))
-                    elif items is not None:
-                        # No list (so a 1-to-1 relation), so there should be an object, or None
-                        item = items  # More clear naming
+            for key, info in relations.iteritems():
+                items = getattr(self, key)
+                if info['list'] is True:
+                    if len(items) > 0:
                         if abandon is not None and (key in abandon or '_all' in abandon):
-                            setattr(item, info['key'], None)
-                            try:
-                                item.save()
-                            except ObjectNotFoundException:
-                                pass
+                            for item in items.itersafe():
+                                setattr(item, info['key'], None)
+                                try:
+                                    item.save()
+                                except ObjectNotFoundException:
+                                    pass
                         else:
-                            raise LinkedObjectException('There is still an item linked in self.{0}'.format(key))
+                            multi = 'are {0} items'.format(len(items)) if len(items) > 1 else 'is 1 item'
+                            raise LinkedObjectException('There {0} left in self.{1}'.format(multi, key))
+                elif items is not None:
+                    # No list (so a 1-to-1 relation), so there should be an object, or None
+                    item = items  # More clear naming
+                    if abandon is not None and (key in abandon or '_all' in abandon):
+                        setattr(item, info['key'], None)
+                        try:
+                            item.save()
+                        except ObjectNotFoundException:
+                            pass
+                    else:
+                        raise LinkedObjectException('There is still an item linked in self.{0}'.format(key))
 
             # Delete the object out of the persistent store
             try:
@@ -784,33 +811,28 @@ class DataObject(object):
                 pass
 
             # Clean indexes
-            base_index_key = 'ovs_index_{0}|{1}|{2}'
-            for prop in self._properties:
-                if prop.indexed is True:
-                    classname = self.__class__.__name__.lower()
-                    key = prop.name
-                    current_value = self._original[key]
-                    index_key = base_index_key.format(classname, key, hashlib.sha1(str(current_value)).hexdigest())
-                    indexed_keys = list(self._persistent.get_multi([index_key], must_exist=False))[0]
-                    if indexed_keys is not None and self._key in indexed_keys:
-                        self._persistent.assert_value(index_key, indexed_keys[:], transaction=transaction)
-                        indexed_keys.remove(self._key)
-                        if len(indexed_keys) == 0:
-                            self._persistent.delete(index_key, transaction=transaction)
-                        else:
-                            self._persistent.set(index_key, indexed_keys, transaction=transaction)
+            index_keys = [self._index_key_prefixes[key] + DalToolbox.get_value_hash(self._original[key])
+                          for key in self._indexed_property_names]
+            if len(index_keys) > 0:
+                # All indexes are fetched at once, instead of one round-trip per index
+                for index_key, indexed_keys in zip(index_keys, self._persistent.get_multi(index_keys, must_exist=False)):
+                    if indexed_keys is None:
+                        continue
+                    remaining_keys = [indexed_key for indexed_key in indexed_keys if indexed_key != self._key]
+                    if len(remaining_keys) == len(indexed_keys):
+                        continue
+                    self._persistent.assert_value(index_key, indexed_keys, transaction=transaction)
+                    if len(remaining_keys) == 0:
+                        self._persistent.delete(index_key, transaction=transaction)
+                    else:
+                        self._persistent.set(index_key, remaining_keys, transaction=transaction)
 
             # Clean reverse indexes
-            base_reverse_key = 'ovs_reverseindex_{0}_{1}|{2}|{3}'
             for relation in self._relations:
                 key = relation.name
                 original_guid = self._original[key]['guid']
                 if original_guid is not None:
-                    if relation.foreign_type is None:
-                        classname = self.__class__.__name__.lower()
-                    else:
-                        classname = relation.foreign_type.__name__.lower()
-                    reverse_key = base_reverse_key.format(classname, original_guid, relation.foreign_key, self.guid)
+                    reverse_key = self._reverse_index_key_templates[key].format(original_guid, self._guid)
                     self._persistent.delete(reverse_key, must_exist=False, transaction=transaction)
 
             # Invalidate property lists
@@ -828,14 +850,12 @@ class DataObject(object):
                 store_data = self._persistent.get(self._key)
             else:
                 store_data = self._original
-            unique_key = 'ovs_unique_{0}_{{0}}_{{1}}'.format(self._classname)
-            for prop in self._properties:
-                if prop.unique is True:
-                    if prop.property_type not in [str, int, float, long]:
-                        raise RuntimeError('A unique constraint can only be set on field of type str, int, float, or long')
-                    key = unique_key.format(prop.name, hashlib.sha1(str(store_data[prop.name])).hexdigest())
-                    self._persistent.assert_value(key, self._key, transaction=transaction)
-                    self._persistent.delete(key, transaction=transaction)
+            for prop in self._unique_properties:
+                if prop.property_type not in [str, int, float, long]:
+                    raise RuntimeError('A unique constraint can only be set on field of type str, int, float, or long')
+                key = self._unique_key_prefixes[prop.name] + DalToolbox.get_value_hash(store_data[prop.name])
+                self._persistent.assert_value(key, self._key, transaction=transaction)
+                self._persistent.delete(key, transaction=transaction)
 
             if _hook is not None:
                 _hook()
@@ -854,6 +874,7 @@ class DataObject(object):
                 if 'ovs_unique' in str(ex.message):
                     optimistic = False
                 last_assert = ex
+                self._backoff(tries)
 
         # Delete the object and its properties out of the volatile store
         self.invalidate_dynamics()
@@ -877,14 +898,17 @@ class DataObject(object):
             properties = [properties]
         for dynamic in self._dynamics:
             if properties is None or dynamic.name in properties:
-                key = '{0}_{1}'.format(self._key, dynamic.name)
-                mutex = volatile_mutex(key)
+                key = self._key + '_' + dynamic.name
+                mutex = volatile_mutex(key) if dynamic.locked else None
+                acquired = False
                 try:
-                    if dynamic.locked:
+                    if mutex is not None:
                         mutex.acquire()
+                        acquired = True
                     self._volatile.delete(key)
                 finally:
-                    mutex.release()
+                    if acquired is True:
+                        mutex.release()
 
     def invalidate_cached_objects(self):
         """
@@ -899,10 +923,11 @@ class DataObject(object):
         """
         return dict((prop.name, self._data[prop.name]) for prop in self._properties)
 
-    def serialize(self, depth=0):
+    def serialize(self, depth=0, include_dynamics=True):
         """
         Serializes the internal data, getting rid of certain metadata like descriptors
         :param depth: Depth of relations to serialize
+        :param include_dynamics: Include the dynamic properties. Leaving them out avoids (potentially expensive) loading of the dynamics
         """
         data = {'guid': self.guid}
         for relation in self._relations:
@@ -912,13 +937,14 @@ class DataObject(object):
             else:
                 instance = getattr(self, key)
                 if instance is not None:
-                    data[key] = getattr(self, key).serialize(depth=(depth - 1))
+                    data[key] = getattr(self, key).serialize(depth=(depth - 1), include_dynamics=include_dynamics)
                 else:
                     data[key] = None
         for prop in self._properties:
             data[prop.name] = self._data[prop.name]
-        for dynamic in self._dynamics:
-            data[dynamic.name] = getattr(self, dynamic.name)
+        if include_dynamics is True:
+            for dynamic in self._dynamics:
+                data[dynamic.name] = getattr(self, dynamic.name)
         return data
 
     def copy(self, other_object, include=None, exclude=None, include_relations=False):
@@ -989,14 +1015,15 @@ class DataObject(object):
     def get_timings(self):
         """
         Retrieve the timings for collecting the dynamic properties of this DataObject
+        Timings are kept unless DataObject.TIME_DYNAMICS is disabled
         """
-        return self._dynamic_timings
+        return self._dynamic_timings if self._dynamic_timings is not None else {}
 
     def reset_timings(self):
         """
         Reset the timings it took for collecting the dynamic properties of this DataObject
         """
-        self._dynamic_timings = {}
+        self._dynamic_timings = None
 
     ##############
     # Properties #
@@ -1017,35 +1044,79 @@ class DataObject(object):
         """
         Handles the internal caching of dynamic properties
         """
-        caller_name = dynamic.name
-        cache_key = '{0}_{1}'.format(self._key, caller_name)
-        mutex = volatile_mutex(cache_key)
+        if dynamic.timeout <= 0 and dynamic.locked is False:
+            # The outcome is never cached, so there is nothing to look up
+            return DalToolbox.convert_unicode_to_string(self._load_dynamic(fct, dynamic))
+        cache_key = self._key + '_' + dynamic.name
+        mutex = None  # Only locked dynamics need a mutex, and only when the value has to be (re)loaded
+        acquired = False
         try:
             cached_data = self._volatile.get(cache_key)
             if cached_data is None:
                 if dynamic.locked:
+                    mutex = volatile_mutex(cache_key)
                     mutex.acquire()
+                    acquired = True
                     cached_data = self._volatile.get(cache_key)
                 if cached_data is None:
-                    function_info = inspect.getargspec(fct)
-                    start = time.time()
-                    if 'dynamic' in function_info.args:
-                        dynamic_data = fct(dynamic=dynamic)  # Load data from backend
-                    else:
-                        dynamic_data = fct()
-                    self._dynamic_timings[caller_name] = time.time() - start
-                    correct, allowed_types, given_type = DalToolbox.check_type(dynamic_data, dynamic.return_type)
-                    if not correct:
-                        raise TypeError('Dynamic property {0} allows types {1}. {2} given'.format(
-                            caller_name, str(allowed_types), given_type
-                        ))
                     # Set the result of the function into a dict to avoid None retrieved from the cache when key is not found
-                    cached_data = {'data': dynamic_data}
+                    cached_data = {'data': self._load_dynamic(fct, dynamic)}
                     if dynamic.timeout > 0:
                         self._volatile.set(cache_key, cached_data, dynamic.timeout)
             return DalToolbox.convert_unicode_to_string(cached_data['data'])
         finally:
-            mutex.release()
+            if acquired is True:
+                mutex.release()
+
+    def _backoff(self, tries):
+        """
+        Waits before retrying a save or delete that failed on a concurrent modification. The upper bound of the
+        random wait doubles with every attempt ("full jitter"), spreading out competing writers
+        :param tries: The amount of attempts done so far
+        :return: None
+        """
+        time.sleep(uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** tries)))
+
+    def _copy_data(self, data):
+        """
+        Copies a data dictionary of this object. It is a faster alternative to a deepcopy, making use of the known
+        structure: immutable values are shared, relations are flat descriptors and only other values are deep-copied
+        :param data: The data dictionary to copy
+        :return: A copy of the data dictionary
+        :rtype: dict
+        """
+        data_copy = {}
+        for key, value in data.iteritems():
+            if isinstance(value, self._immutable_types):
+                data_copy[key] = value
+            elif key in self._relation_names:
+                data_copy[key] = dict(value)
+            else:
+                data_copy[key] = copy.deepcopy(value)
+        return data_copy
+
+    def _load_dynamic(self, fct, dynamic):
+        """
+        Loads the value of a dynamic property from its implementing function, validating its type
+        """
+        caller_name = dynamic.name
+        start = time.time() if DataObject.TIME_DYNAMICS is True else None
+        if dynamic.accepts_dynamic(fct):
+            dynamic_data = fct(dynamic=dynamic)  # Load data from backend
+        else:
+            dynamic_data = fct()
+        if start is not None:
+            if self._dynamic_timings is None:
+                self._dynamic_timings = {}
+            self._dynamic_timings[caller_name] = time.time() - start
+        if dynamic_data is None or (dynamic.allowed_types is not None and isinstance(dynamic_data, dynamic.allowed_types)):
+            return dynamic_data
+        correct, allowed_types, given_type = DalToolbox.check_type(dynamic_data, dynamic.return_type)
+        if not correct:
+            raise TypeError('Dynamic property {0} allows types {1}. {2} given'.format(
+                caller_name, str(allowed_types), given_type
+            ))
+        return dynamic_data
 
     def __repr__(self):
         """
@@ -1055,10 +1126,18 @@ class DataObject(object):
 
     def __str__(self):
         """
-        The string representation of a DataObject is the serialized value
+        The string representation of a DataObject is its serialized stored state. Dynamics are left out, as
+        evaluating them would make every log statement involving a DataObject potentially very expensive.
+        Use to_json() to include them
+        """
+        # The encoder's default acts as a fallback
+        return DataObject.STR_ENCODER.encode(self.serialize(include_dynamics=False))
+
+    def to_json(self):
+        """
+        Returns the full serialized value, including all dynamics, as a JSON string
         """
-        # cls= acts as a fallback
-        return json.dumps(self.serialize(), indent=4, cls=DataObjectAttributeEncoder)
+        return DataObject.STR_ENCODER.encode(self.serialize())
 
     def __hash__(self):
         """
@@ -1102,8 +1181,7 @@ class DataObject(object):
             for dynamic in dynamics:
                 start = time.time()
                 fct = getattr(self, '_{0}'.format(dynamic.name))
-                function_info = inspect.getargspec(fct)
-                if 'dynamic' in function_info.args:
+                if dynamic.accepts_dynamic(fct):
                     fct(dynamic=dynamic)
                 else:
                     fct()
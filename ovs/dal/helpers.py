@@ -116,6 +116,18 @@ class Descriptor(object):
         else:
             return cls
 
+    @staticmethod
+    def load_class(descriptor):
+        """
+        Returns the class to which a descriptor dictionary points. Resolved classes are served from the
+        object cache, avoiding a Descriptor instance and a copy of the given dictionary on every call
+        :param descriptor: descriptor dict
+        """
+        cls = Descriptor.object_cache.get(descriptor['identifier'])
+        if cls is None:
+            cls = Descriptor().load(descriptor).get_object()
+        return cls
+
     @staticmethod
     def isinstance(instance, object_type):
         """"
@@ -145,6 +157,24 @@ class HybridRunner(object):
     """
 
     cache = {}
+    hybrid_cache = {}
+
+    @staticmethod
+    def get_hybrid(object_type):
+        """
+        Returns the hybrid class to use for a given hybrid class. When the hybrid got extended, the extending
+        hybrid is returned, otherwise the given class itself. The outcome is cached per class
+        :param object_type: Hybrid class
+        :return: The hybrid class to use
+        """
+        if object_type not in HybridRunner.hybrid_cache:
+            hybrid_structure = HybridRunner.get_hybrids()
+            identifier = Descriptor(object_type).descriptor['identifier']
+            if identifier in hybrid_structure and identifier != hybrid_structure[identifier]['identifier']:
+                HybridRunner.hybrid_cache[object_type] = Descriptor.load_class(hybrid_structure[identifier])
+            else:
+                HybridRunner.hybrid_cache[object_type] = object_type
+        return HybridRunner.hybrid_cache[object_type]
 
     @staticmethod
     def get_hybrids():
@@ -221,6 +251,51 @@ class DalToolbox(object):
     Generic class for various methods
     """
 
+    allowed_types_cache = {}
+    BOOLEAN_HASHES = {True: hashlib.sha1(str(True)).hexdigest(),
+                      False: hashlib.sha1(str(False)).hexdigest()}
+    ALLOWED_TYPE_NAMES = {str: ['str', 'unicode', 'basestring'],
+                          float: ['float', 'int'],
+                          int: ['int', 'long'],
+                          long: ['int', 'long']}
+
+    @staticmethod
+    def get_allowed_types(required_type):
+        """
+        Resolves the types a value can have to be accepted for a given required type. The outcome only
+        depends on the required type, so it is cached.
+        :param required_type: The required type (a type, or a list of enum values)
+        :return: Tuple of accepted types, usable by isinstance. None for an enum
+        :rtype: tuple
+        """
+        if isinstance(required_type, list):
+            return None
+        if required_type not in DalToolbox.allowed_types_cache:
+            if required_type is str:
+                allowed_types = (basestring,)
+            elif required_type is float:
+                allowed_types = (float, int)
+            elif required_type is int or required_type is long:
+                allowed_types = (int, long)
+            else:
+                allowed_types = (required_type,)
+            DalToolbox.allowed_types_cache[required_type] = allowed_types
+        return DalToolbox.allowed_types_cache[required_type]
+
+    @staticmethod
+    def get_value_hash(value):
+        """
+        Returns the hash of a value as used in index and unique constraint keys. The hash only serves as a
+        bucket identifier, but it is part of the keys stored in the persistent backend and can't be changed
+        without migrating those keys. Booleans, the most common low-cardinality index values, are precomputed
+        :param value: The (indexed or unique) value
+        :return: The hex digest identifying the value
+        :rtype: str
+        """
+        if value is True or value is False:
+            return DalToolbox.BOOLEAN_HASHES[value]
+        return hashlib.sha1(str(value)).hexdigest()
+
     @staticmethod
     def check_type(value, required_type):
         """
@@ -229,31 +304,20 @@ class DalToolbox(object):
           - A 'str' type accepts 'str', 'unicode' and 'basestring'
           - A 'float' type accepts 'float', 'int'
           - A list instance acts like an enum
+        The names of the allowed types are only built when the value is not correct
         """
-        given_type = type(value)
-        if required_type is str:
-            correct = isinstance(value, basestring) or value is None
-            allowed_types = ['str', 'unicode', 'basestring']
-        elif required_type is float:
-            correct = isinstance(value, float) or isinstance(value, int) or value is None
-            allowed_types = ['float', 'int']
-        elif required_type is int or required_type is long:
-            correct = isinstance(value, int) or isinstance(value, long) or value is None
-            allowed_types = ['int', 'long']
-        elif isinstance(required_type, list):
+        if isinstance(required_type, list):
             # We're in an enum scenario. Field_type isn't a real type, but a list containing
             # all possible enum values. Here as well, we need to do some str/unicode/basestring
             # checking.
             if isinstance(required_type[0], basestring):
                 value = str(value)
-            correct = value in required_type
-            allowed_types = required_type
-            given_type = value
-        else:
-            correct = isinstance(value, required_type) or value is None
-            allowed_types = [required_type.__name__]
+            return value in required_type, required_type, value
 
-        return correct, allowed_types, given_type
+        given_type = type(value)
+        if value is None or isinstance(value, DalToolbox.get_allowed_types(required_type)):
+            return True, None, given_type
+        return False, DalToolbox.ALLOWED_TYPE_NAMES.get(required_type, [required_type.__name__]), given_type
 
     @staticmethod
     def extract_key(obj, field):
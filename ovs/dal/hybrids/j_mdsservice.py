@@ -53,6 +53,5 @@ class MDSService(DataObject):
         Reloads the StorageDriver Client
         """
         if self.service:
-            self._frozen = False
+            # The client attribute is created in __init__, so it can be replaced without unfreezing the object
             self.metadataserver_client = MetadataServerClient.load(self.service)
-            self._frozen = True
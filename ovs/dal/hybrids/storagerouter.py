@@ -54,6 +54,8 @@ class StorageRouter(DataObject):
                                                             'BLOCK_CACHE': 'block-cache',
                                                             'AUTO_CLEANUP': 'auto-cleanup-deleted-namespaces'})
     STORAGEDRIVER_FEATURES = DataObject.enumerator('Storagedriver_features', {'DIRECTORY_UNLINK': 'directory_unlink'})
+    HEARTBEAT_FAILURE_DELAY = 60 * 5  # Heartbeat delay (seconds) above which the status is FAILURE
+    HEARTBEAT_WARNING_DELAY = 60 * 2  # Celery heartbeat delay (seconds) above which the status is WARNING
 
     def _statistics(self, dynamic):
         """
@@ -61,19 +63,14 @@ class StorageRouter(DataObject):
         """
         from ovs.dal.hybrids.vdisk import VDisk
         statistics = {}
-        for storagedriver in self.storagedrivers:
-            for key, value in storagedriver.fetch_statistics().iteritems():
+        for storagedriver_statistics in [storagedriver.fetch_statistics() for storagedriver in self.storagedrivers]:
+            for key, value in storagedriver_statistics.iteritems():
                 if isinstance(value, dict):
-                    if key not in statistics:
-                        statistics[key] = {}
-                        for subkey, subvalue in value.iteritems():
-                            if subkey not in statistics[key]:
-                                statistics[key][subkey] = 0
-                            statistics[key][subkey] += subvalue
+                    substatistics = statistics.setdefault(key, {})
+                    for subkey, subvalue in value.iteritems():
+                        substatistics[subkey] = substatistics.get(subkey, 0) + subvalue
                 else:
-                    if key not in statistics:
-                        statistics[key] = 0
-                    statistics[key] += value
+                    statistics[key] = statistics.get(key, 0) + value
         statistics['timestamp'] = time.time()
         VDisk.calculate_delta(self._key, dynamic, statistics)
         return statistics
@@ -84,12 +81,13 @@ class StorageRouter(DataObject):
         """
         from ovs.dal.lists.vdisklist import VDiskList
         volume_ids = []
-        vpools = set()
-        storagedriver_ids = []
+        vpools = {}
+        storagedriver_ids = set()
         for storagedriver in self.storagedrivers:
-            vpools.add(storagedriver.vpool)
-            storagedriver_ids.append(storagedriver.storagedriver_id)
-        for vpool in vpools:
+            if storagedriver.vpool_guid not in vpools:  # Every vPool's registrations only need to be listed once
+                vpools[storagedriver.vpool_guid] = storagedriver.vpool
+            storagedriver_ids.add(storagedriver.storagedriver_id)
+        for vpool in vpools.itervalues():
             for entry in vpool.objectregistry_client.get_all_registrations():
                 if entry.node_id() in storagedriver_ids:
                     volume_ids.append(entry.object_id())
@@ -108,26 +106,23 @@ class StorageRouter(DataObject):
         """
         Calculates the current Storage Router status based on various heartbeats
         """
-        pointer = 0
-        statusses = ['OK', 'WARNING', 'FAILURE']
-        current_time = time.time()
+        status = 'OK'
         if self.heartbeats is not None:
-            process_delay = abs(self.heartbeats.get('process', 0) - current_time)
-            if process_delay > 60 * 5:
-                pointer = max(pointer, 2)
-            else:
-                delay = abs(self.heartbeats.get('celery', 0) - current_time)
-                if delay > 60 * 5:
-                    pointer = max(pointer, 2)
-                elif delay > 60 * 2:
-                    pointer = max(pointer, 1)
+            current_time = time.time()
+            if abs(self.heartbeats.get('process', 0) - current_time) > StorageRouter.HEARTBEAT_FAILURE_DELAY:
+                return 'FAILURE'
+            delay = abs(self.heartbeats.get('celery', 0) - current_time)
+            if delay > StorageRouter.HEARTBEAT_FAILURE_DELAY:
+                return 'FAILURE'
+            if delay > StorageRouter.HEARTBEAT_WARNING_DELAY:
+                status = 'WARNING'
         for disk in self.disks:
             if disk.state == 'MISSING':
-                pointer = max(pointer, 2)
+                return 'FAILURE'
             for partition in disk.partitions:
                 if partition.state == 'MISSING':
-                    pointer = max(pointer, 2)
-        return statusses[pointer]
+                    return 'FAILURE'
+        return status
 
     def _partition_config(self):
         """
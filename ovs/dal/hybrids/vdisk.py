@@ -417,16 +417,17 @@ class VDisk(DataObject):
         volatile = VolatileFactory.get_client()
         prev_key = '{0}_{1}'.format(key, 'statistics_previous')
         previous_stats = volatile.get(prev_key, default={})
+        delta = current_stats['timestamp'] - previous_stats.get('timestamp', current_stats['timestamp'])
         for key in current_stats.keys():
             if key == 'timestamp' or '_latency' in key or '_distribution' in key:
                 continue
-            delta = current_stats['timestamp'] - previous_stats.get('timestamp', current_stats['timestamp'])
+            ps_key = key + '_ps'
             if delta == 0:
-                current_stats['{0}_ps'.format(key)] = previous_stats.get('{0}_ps'.format(key), 0)
+                current_stats[ps_key] = previous_stats.get(ps_key, 0)
             elif delta > 0 and key in previous_stats:
-                current_stats['{0}_ps'.format(key)] = max(0, (current_stats[key] - previous_stats[key]) / delta)
+                current_stats[ps_key] = max(0, (current_stats[key] - previous_stats[key]) / delta)
             else:
-                current_stats['{0}_ps'.format(key)] = 0
+                current_stats[ps_key] = 0
         volatile.set(prev_key, current_stats, dynamic.timeout * 10)
 
     def reload_client(self, client):
@@ -434,14 +435,13 @@ class VDisk(DataObject):
         Reloads the StorageDriverClient or ObjectRegistryClient
         """
         if self.vpool_guid:
-            self._frozen = False
+            # The client attributes are created in __init__, so they can be replaced without unfreezing the object
             if client == 'storagedriver':
                 self._storagedriver_client = StorageDriverClient.load(self.vpool)
             elif client == 'objectregistry':
                 self._objectregistry_client = ObjectRegistryClient.load(self.vpool)
             elif client == 'filesystem_metadata':
                 self._fsmetadata_client = FSMetaDataClient.load(self.vpool)
-            self._frozen = True
 
     def _being_scrubbed(self):
         """
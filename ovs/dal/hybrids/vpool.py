@@ -100,35 +100,40 @@ class VPool(DataObject):
         """
         Reloads the StorageDriverClient, ObjectRegistryClient or ClusterRegistry client
         """
-        self._frozen = False
+        # The client attributes are created in __init__, so they can be replaced without unfreezing the object
         if client == 'storagedriver':
             self._storagedriver_client = StorageDriverClient.load(self)
         elif client == 'objectregistry':
             self._objectregistry_client = ObjectRegistryClient.load(self)
         elif client == 'clusterregistry':
             self._clusterregistry_client = ClusterRegistryClient.load(self)
-        self._frozen = True
 
     def _configuration(self):
         """
         VPool configuration
         """
-        if not self.storagedrivers or not self.storagedrivers[0].storagerouter:
+        storagedrivers = self.storagedrivers
+        if not storagedrivers:
+            return {}
+        storagedriver = storagedrivers[0]
+        if not storagedriver.storagerouter:
             return {}
 
-        storagedriver_config = StorageDriverConfiguration(self.guid, self.storagedrivers[0].storagedriver_id).configuration # type: StorageDriverConfig
+        storagedriver_config = StorageDriverConfiguration(self.guid, storagedriver.storagedriver_id).configuration # type: StorageDriverConfig
 
         file_system = storagedriver_config.filesystem_config
         volume_manager = storagedriver_config.volume_manager_config
+        dtl_config = storagedriver_config.dtl_config
+        vrouter_config = storagedriver_config.vrouter_config
 
         dtl_host = file_system.fs_dtl_host
         dtl_mode = file_system.fs_dtl_mode or  VOLDRV_DTL_ASYNC
         dtl_config_mode = file_system.fs_dtl_config_mode
-        dtl_transport = storagedriver_config.dtl_config.dtl_transport
+        dtl_transport = dtl_config.dtl_transport
         cluster_size = volume_manager.default_cluster_size / 1024
         tlog_multiplier = volume_manager.number_of_scos_in_tlog
         non_disposable_sco_factor = volume_manager.non_disposable_scos_factor
-        sco_multiplier = storagedriver_config.vrouter_config.vrouter_sco_multiplier
+        sco_multiplier = vrouter_config.vrouter_sco_multiplier
 
         sco_size = sco_multiplier * cluster_size / 1024  # SCO size is in MiB ==> SCO multiplier * cluster size (4 KiB by default)
         write_buffer = tlog_multiplier * sco_size * non_disposable_sco_factor
@@ -154,20 +159,19 @@ class VPool(DataObject):
         Aggregates the Statistics (IOPS, Bandwidth, ...) of each vDisk served by the vPool.
         """
         from ovs.dal.hybrids.vdisk import VDisk
+        storagedrivers = list(self.storagedrivers)
+        if len(storagedrivers) == 0:
+            # Nothing to aggregate, nor to calculate a delta for
+            return {'timestamp': time.time()}
         statistics = {}
-        for storagedriver in self.storagedrivers:
+        for storagedriver in storagedrivers:
             for key, value in storagedriver.fetch_statistics().iteritems():
                 if isinstance(value, dict):
-                    if key not in statistics:
-                        statistics[key] = {}
-                        for subkey, subvalue in value.iteritems():
-                            if subkey not in statistics[key]:
-                                statistics[key][subkey] = 0
-                            statistics[key][subkey] += subvalue
+                    substatistics = statistics.setdefault(key, {})
+                    for subkey, subvalue in value.iteritems():
+                        substatistics[subkey] = substatistics.get(subkey, 0) + subvalue
                 else:
-                    if key not in statistics:
-                        statistics[key] = 0
-                    statistics[key] += value
+                    statistics[key] = statistics.get(key, 0) + value
         statistics['timestamp'] = time.time()
         VDisk.calculate_delta(self._key, dynamic, statistics)
         return statistics
@@ -176,14 +180,17 @@ class VPool(DataObject):
         """
         An identifier of this vPool in its current configuration state
         """
-        return '{0}_{1}'.format(self.guid, '_'.join(self.storagedrivers_guids))
+        return self.guid + '_' + '_'.join(self.storagedrivers_guids)
 
     def _extensible(self):
         """
         Verifies whether this vPool can be extended or not
         """
+        status = self.status
+        if status == VPool.STATUSES.RUNNING and self.metadata_store_bits is not None:
+            return True, []
         reasons = []
-        if self.status != VPool.STATUSES.RUNNING:
+        if status != VPool.STATUSES.RUNNING:
             reasons.append('non_running')
         if self.metadata_store_bits is None:
             reasons.append('voldrv_missing_info')
@@ -201,10 +208,10 @@ class VPool(DataObject):
         for storagedriver in self.storagedrivers:
             volume_potential = -1
             try:
-                std_config = StorageDriverConfiguration(storagedriver.vpool_guid, storagedriver.storagedriver_id)
+                std_config = StorageDriverConfiguration(self.guid, storagedriver.storagedriver_id)
                 client = LocalStorageRouterClient(std_config.remote_path)
                 volume_potential = client.volume_potential(str(storagedriver.storagedriver_id))
             except Exception:
                 self._logger.exception('Unable to retrieve configuration for storagedriver {0}'.format(storagedriver.storagedriver_id))
-            volume_potentials[storagedriver.storagerouter.guid] = volume_potential
+            volume_potentials[storagedriver.storagerouter_guid] = volume_potential
         return volume_potentials
@@ -154,7 +154,7 @@ class DALMigrator(object):
         # From here on, all actual migration should happen to get to the expected state for THIS RELEASE
         elif working_version < DALMigrator.THIS_VERSION:
             from ovs.dal.datalist import DataList
-            from ovs.dal.helpers import HybridRunner, Descriptor
+            from ovs.dal.helpers import DalToolbox, HybridRunner, Descriptor
             from ovs.dal.hybrids.diskpartition import DiskPartition
             from ovs.dal.hybrids.j_storagedriverpartition import StorageDriverPartition
             from ovs.dal.lists.vpoollist import VPoolList
@@ -186,12 +186,12 @@ class DALMigrator(object):
                     prefix = 'ovs_data_{0}_'.format(classname)
                     for key, data in persistent_client.prefix_entries(prefix):
                         for property_name in uniques:
-                            ukey = '{0}{1}'.format(unique_key.format(property_name), hashlib.sha1(str(data[property_name])).hexdigest())
+                            ukey = '{0}{1}'.format(unique_key.format(property_name), DalToolbox.get_value_hash(data[property_name]))
                             persistent_client.set(ukey, key)
                         for property_name in indexes:
                             if property_name not in data:
                                 continue  # This is the case when there's a new indexed property added.
-                            ikey = index_key.format(property_name, hashlib.sha1(str(data[property_name])).hexdigest())
+                            ikey = index_key.format(property_name, DalToolbox.get_value_hash(data[property_name]))
                             index = list(persistent_client.get_multi([ikey], must_exist=False))[0]
                             transaction = persistent_client.begin_transaction()
                             if index is None:
@@ -52,11 +52,7 @@ class RelationMapper(object):
                 if relation.foreign_type is None:
                     remote_class = cls
                 else:
-                    identifier = Descriptor(relation.foreign_type).descriptor['identifier']
-                    if identifier in hybrid_structure and identifier != hybrid_structure[identifier]['identifier']:
-                        remote_class = Descriptor().load(hybrid_structure[identifier]).get_object()
-                    else:
-                        remote_class = relation.foreign_type
+                    remote_class = HybridRunner.get_hybrid(relation.foreign_type)
                 itemname = remote_class.__name__
                 if itemname == object_type.__name__:
                     relation_info[relation.foreign_key] = {'class': Descriptor(cls).descriptor,
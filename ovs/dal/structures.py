@@ -17,12 +17,15 @@
 """
 Module containing various helping structures
 """
+import inspect
+from ovs.dal.helpers import DalToolbox
 
 
 class Property(object):
     """
     Property
     """
+    __slots__ = ('name', 'property_type', 'default', 'docstring', 'mandatory', 'unique', 'indexed', 'allowed_types')
 
     def __init__(self, name, property_type, mandatory=True, default=None, unique=False, indexed=False, doc=None):
         """
@@ -35,12 +38,14 @@ class Property(object):
         self.mandatory = mandatory
         self.unique = unique
         self.indexed = indexed
+        self.allowed_types = DalToolbox.get_allowed_types(property_type)  # None for enums
 
 
 class Relation(object):
     """
     Relation
     """
+    __slots__ = ('name', 'foreign_type', 'foreign_key', 'mandatory', 'onetoone', 'docstring')
 
     def __init__(self, name, foreign_type, foreign_key, mandatory=True, onetoone=False, doc=None):
         """
@@ -58,6 +63,7 @@ class Dynamic(object):
     """
     Dynamic property
     """
+    __slots__ = ('name', 'return_type', 'timeout', 'locked', 'allowed_types', '_accepts_dynamic')
 
     def __init__(self, name, return_type, timeout, locked=False):
         """
@@ -67,3 +73,18 @@ class Dynamic(object):
         self.return_type = return_type
         self.timeout = timeout
         self.locked = locked
+        self.allowed_types = DalToolbox.get_allowed_types(return_type)  # None for enums
+        self._accepts_dynamic = {}
+
+    def accepts_dynamic(self, function):
+        """
+        Checks whether the function implementing this dynamic expects the dynamic as 'dynamic' argument.
+        The outcome is cached per function, as the signature does not change
+        :param function: The (bound) function implementing this dynamic
+        :return: True if the function has a 'dynamic' argument
+        :rtype: bool
+        """
+        function = getattr(function, 'im_func', function)  # Extended hybrids can implement the same dynamic differently
+        if function not in self._accepts_dynamic:
+            self._accepts_dynamic[function] = 'dynamic' in inspect.getargspec(function).args
+        return self._accepts_dynamic[function]
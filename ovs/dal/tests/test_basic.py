@@ -17,6 +17,7 @@
 """
 Basic test module
 """
+import json
 import time
 import uuid
 import hashlib
@@ -235,6 +236,7 @@ class Basic(unittest.TestCase):
         machine = TestMachine()
         machine.name = 'machine'
         machine.save()
+        disks = []
         disk_guids = []
         for i in xrange(0, 20):
             disk = TestDisk()
@@ -245,26 +247,26 @@ class Basic(unittest.TestCase):
             else:
                 disk.storage = machine
             disk.save()
+            disks.append(disk)
             disk_guids.append(disk.guid)
 
         # Test queries on full lists
         self.assertEqual(len(machine.disks), 10, 'query should find added machines')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('size', DataList.operator.EQUALS, 1)]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disk 1')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('size', DataList.operator.GT, 3),
                                               ('size', DataList.operator.LT, 6)]})
-        expected_disks = [TestDisk(disk_guids[4]), TestDisk(disk_guids[5])]  # Should find disk 4 and 5
+        expected_disks = [disks[4], disks[5]]  # Should find disk 4 and 5
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 2')
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 4, 5')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.OR,
                                     'items': [('size', DataList.operator.LT, 3),
                                               ('size', DataList.operator.GT, 6)]})
-        expected_disks = [TestDisk(disk_guids[0]), TestDisk(disk_guids[1]), TestDisk(disk_guids[2]), TestDisk(disk_guids[7]),
-                          TestDisk(disk_guids[8]), TestDisk(disk_guids[9])] + [TestDisk(disk_guids[i]) for i in xrange(10, 20)]
+        expected_disks = [disks[0], disks[1], disks[2], disks[7], disks[8], disks[9]] + disks[10:20]
         self.assertGreaterEqual(len(dlist), len(expected_disks), 'List should contain 16')  # At least disk 0, 1, 2, 7, 8, 9, 10-19
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 0, 1, 2, 7, 8, 9, 10-19')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
@@ -272,8 +274,7 @@ class Basic(unittest.TestCase):
                                               {'type': DataList.where_operator.OR,
                                                'items': [('size', DataList.operator.LT, 3),
                                                          ('size', DataList.operator.GT, 6)]}]})
-        expected_disks = [TestDisk(disk_guids[0]), TestDisk(disk_guids[1]), TestDisk(disk_guids[2]),
-                          TestDisk(disk_guids[7]), TestDisk(disk_guids[8]), TestDisk(disk_guids[9])]
+        expected_disks = [disks[0], disks[1], disks[2], disks[7], disks[8], disks[9]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 6')  # Disk 0, 1, 2, 7, 8, 9
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 0, 1, 2, 7, 8, 9')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
@@ -287,43 +288,42 @@ class Basic(unittest.TestCase):
                                               {'type': DataList.where_operator.AND,
                                                'items': [('size', DataList.operator.GT, 3),
                                                          ('size', DataList.operator.LT, 6)]}]})
-        expected_disks = [TestDisk(disk_guids[4]), TestDisk(disk_guids[5])]
+        expected_disks = [disks[4], disks[5]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 2')  # Disk 4 and 5
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 4, 5')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('machine.name', DataList.operator.EQUALS, 'machine'),
                                               ('name', DataList.operator.EQUALS, 'test_3')]})
-        expected_disks = [TestDisk(disk_guids[3])]
+        expected_disks = [disks[3]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Disk 3
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disk 3')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('size', DataList.operator.GT, 3),
                                               {'type': DataList.where_operator.AND,
                                                'items': [('size', DataList.operator.LT, 6)]}]})
-        expected_disks = [TestDisk(disk_guids[4]), TestDisk(disk_guids[5])]
+        expected_disks = [disks[4], disks[5]]
         self.assertEqual(len(dlist), len(expected_disks), 'list should contain 2')  # Disk 4 and 5
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 4, 5')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.OR,
                                     'items': [('size', DataList.operator.LT, 3),
                                               {'type': DataList.where_operator.OR,
                                                'items': [('size', DataList.operator.GT, 6)]}]})
-        expected_disks = [TestDisk(disk_guids[0]), TestDisk(disk_guids[1]), TestDisk(disk_guids[2]), TestDisk(disk_guids[7]),
-                          TestDisk(disk_guids[8]), TestDisk(disk_guids[9])] + [TestDisk(disk_guids[i]) for i in xrange(10, 20)]
+        expected_disks = [disks[0], disks[1], disks[2], disks[7], disks[8], disks[9]] + disks[10:20]
         self.assertGreaterEqual(len(dlist), len(expected_disks), 'List should contain 16')  # At least disk 0, 1, 2, 7, 8, 9, 10-19
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 0, 1, 2, 7, 8, 9, 10-19')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('storage.name', DataList.operator.EQUALS, 'machine')]})
-        expected_disks = [TestDisk(disk_guids[i]) for i in xrange(10, 20)]
+        expected_disks = disks[10:20]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 10')  # Disk 10-19
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 10-19')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.EQUALS, 'test_1')]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Single disk
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disk 1')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.EQUALS, 'tESt_1', False)]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Single disk
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disk 1')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
@@ -338,27 +338,27 @@ class Basic(unittest.TestCase):
         self.assertItemsEqual(dlist, expected_disks, 'List should contain no disks')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.CONTAINS, 'test_1')]})
-        expected_disks = [TestDisk(disk_guids[1])] + [TestDisk(disk_guids[i]) for i in xrange(10, 20)]
+        expected_disks = [disks[1]] + disks[10:20]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 11')  # Disk test_1, test_10-19
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 1, 10-19')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.IN, ['test_1', 'test_2'])]})
-        expected_disks = [TestDisk(disk_guids[1]), TestDisk(disk_guids[2])]
+        expected_disks = [disks[1], disks[2]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 2')  # Disk test_1, test_2
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 1, 2')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.IN, ['test_1', 'tEst_2'])]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Disk test_1
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 1')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.IN, ['test_1', 'tEst_2'], False)]})
-        expected_disks = [TestDisk(disk_guids[1]), TestDisk(disk_guids[2])]
+        expected_disks = [disks[1], disks[2]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 2')  # Disk test_1, test_2
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 1, 2')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.IN, 'foo_test_1_bar')]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Disk test_1
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disks 1')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
@@ -368,15 +368,16 @@ class Basic(unittest.TestCase):
         self.assertItemsEqual(dlist, expected_disks, 'List should contain no disks')
         dlist = DataList(TestDisk, {'type': DataList.where_operator.AND,
                                     'items': [('name', DataList.operator.IN, 'foo_tEst_1_bar', False)]})
-        expected_disks = [TestDisk(disk_guids[1])]
+        expected_disks = [disks[1]]
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')  # Disk test_1
         self.assertItemsEqual(dlist, expected_disks, 'List should contain disk 1')
 
         # Test queries on partial lists, add 5 disks with machine and 5 with storage
-        partial_disk_guids = disk_guids[0:5] + disk_guids[10:15]
+        partial_disks = disks[0:5] + disks[10:15]
+        partial_disk_guids = [disk.guid for disk in partial_disks]
 
         dlist = DataList(TestDisk, guids=partial_disk_guids)
-        expected_disks = [TestDisk(i) for i in partial_disk_guids]  # Disk test_0-5, test_10-14
+        expected_disks = partial_disks  # Disk test_0-5, test_10-14
         self.assertEqual(len(dlist), len(partial_disk_guids), 'List should contain 10')
         self.assertSequenceEqual(dlist, expected_disks, 'List should contain Disk test_0-5, test_10-14')  # Order matters
         # Apply a query
@@ -384,7 +385,7 @@ class Basic(unittest.TestCase):
                          query={'type': DataList.where_operator.AND,
                                 'items': [('size', DataList.operator.EQUALS, 1)]},
                          guids=partial_disk_guids)
-        expected_disks = [TestDisk(partial_disk_guids[1])]  # Disk test_1
+        expected_disks = [partial_disks[1]]  # Disk test_1
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 1')
         self.assertSequenceEqual(dlist, expected_disks, 'List should contain Disk test_1')  # Order matters
         # Apply different query which does not contain any items because of the provided guids
@@ -399,22 +400,22 @@ class Basic(unittest.TestCase):
         dlist.set_query({'type': DataList.where_operator.AND,
                          'items': [('size', DataList.operator.LT, 10)]})
         # Only expect the first five. The supplied guids should be the base
-        expected_disks = [TestDisk(partial_disk_guids[i]) for i in xrange(0, 5)]  # Disk test_0-5
+        expected_disks = partial_disks[0:5]  # Disk test_0-5
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 5')
         self.assertSequenceEqual(dlist, expected_disks, 'List should contain Disk test_0-5')  # Order matters
         # Reset the query
         dlist.set_query(None)
-        expected_disks = [TestDisk(i) for i in partial_disk_guids]  # Disk test_0-5, test_10-14
+        expected_disks = partial_disks  # Disk test_0-5, test_10-14
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 10')
         self.assertSequenceEqual(dlist, expected_disks, 'List should contain Disk test_0-5, test_10-14')  # Order matters
         # Use new guids
         dlist.set_guids(partial_disk_guids[0:5])
-        expected_disks = [TestDisk(i) for i in partial_disk_guids[0:5]]  # Disk test_0-5, test_10-14
+        expected_disks = partial_disks[0:5]  # Disk test_0-5, test_10-14
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 5')
         self.assertSequenceEqual(dlist, expected_disks, 'List should contain Disk test_0-5')  # Order matters
         # Reset the guids
         dlist.set_guids(None)
-        expected_disks = [TestDisk(i) for i in disk_guids]  # Disk test_0-20
+        expected_disks = disks  # Disk test_0-20
         self.assertEqual(len(dlist), len(expected_disks), 'List should contain 20')
         self.assertItemsEqual(dlist, expected_disks, 'List should contain Disk test_0-20')  # Order no longer important
 
@@ -422,22 +423,24 @@ class Basic(unittest.TestCase):
         """
         Tests if the order of the supplied guids is respected
         """
+        disks = []
         disk_guids = []
         for i in xrange(0, 20):
             disk = TestDisk()
             disk.name = 'test_{0}'.format(i)
             disk.size = i
             disk.save()
+            disks.append(disk)
             disk_guids.append(disk.guid)
 
         dlist0 = DataList(TestDisk, guids=disk_guids)
-        expected_items = [TestDisk(guid) for guid in disk_guids]
+        expected_items = disks
         self.assertEqual(len(dlist0), len(expected_items), 'Number of items should be identical')
         # Care about the order
         self.assertSequenceEqual(dlist0, expected_items, 'Items and order should be identical')
 
         dlist1 = DataList(TestDisk, guids=list(reversed(disk_guids)))
-        expected_items = [TestDisk(guid) for guid in reversed(disk_guids)]
+        expected_items = list(reversed(disks))
         self.assertEqual(len(dlist1), len(expected_items), 'Number of items should be identical')
         self.assertSequenceEqual(dlist1, expected_items, 'Items and order should be identical')
         self.assertNotEqual(dlist1._key, dlist0._key, 'Keys should be different')
@@ -591,16 +594,17 @@ class Basic(unittest.TestCase):
         filtered = disks[1:4]
         self.assertEqual(filtered[0].name, 'disk_1', 'Disks should be properly sliced')
         self.assertEqual(filtered[2].name, 'disk_3', 'Disks should be properly sliced')
+        extract_key = DalToolbox.extract_key
         fields = [('name', True), ('size', False)]
-        for field in fields:
-            disks.sort(key=lambda a: DalToolbox.extract_key(a, field[0]), reverse=field[1])
+        for field_name, reverse in fields:
+            disks.sort(key=lambda a: extract_key(a, field_name), reverse=reverse)
         self.assertEqual(disks[0].size, 0, 'Disk should be properly sorted')
         self.assertEqual(disks[1].size, 0, 'Disk should be properly sorted')
         self.assertEqual(disks[0].name, 'disk_7', 'Disk should be properly sorted')
         self.assertEqual(disks[1].name, 'disk_2', 'Disk should be properly sorted')
         fields = [('name', False), ('predictable', False)]
-        for field in fields:
-            disks.sort(key=lambda a: DalToolbox.extract_key(a, field[0]), reverse=field[1])
+        for field_name, reverse in fields:
+            disks.sort(key=lambda a: extract_key(a, field_name), reverse=reverse)
         self.assertEqual(disks[0].predictable, 0, 'Disk should be properly sorted')
         self.assertEqual(disks[1].predictable, 0, 'Disk should be properly sorted')
         self.assertEqual(disks[2].predictable, 1, 'Disk should be properly sorted')
@@ -939,6 +943,30 @@ class Basic(unittest.TestCase):
         dictionary = disk.serialize(depth=1)
         self.assertIn('machine', dictionary, 'Serialized object should have correct depth')
         self.assertEqual(dictionary['machine']['name'], 'machine', 'Serialized object should have correct properties at all depths')
+        self.assertIn('used_size', dictionary, 'Serialized object should have its dynamics')
+        dictionary = disk.serialize(include_dynamics=False)
+        self.assertEqual(dictionary['name'], 'disk', 'Serialized object should have correct name')
+        self.assertNotIn('used_size', dictionary, 'Serialized object should not have dynamics when excluded')
+        dictionary = json.loads(str(disk))
+        self.assertEqual(dictionary['name'], 'disk', 'String representation should have correct name')
+        self.assertNotIn('used_size', dictionary, 'String representation should not load the dynamics')
+        dictionary = json.loads(disk.to_json())
+        self.assertEqual(dictionary['name'], 'disk', 'JSON representation should have correct name')
+        self.assertIn('used_size', dictionary, 'JSON representation should have its dynamics')
+
+    def test_dynamic_timings(self):
+        """
+        Validates whether the time it took to load a dynamic is kept, as reported by the API
+        """
+        disk = TestDisk()
+        disk.size = 1000000
+        self.assertEqual(disk.get_timings(), {}, 'No dynamic was loaded yet')
+        _ = disk.used_size
+        timings = disk.get_timings()
+        self.assertIn('used_size', timings, 'Loading a dynamic should be timed')
+        self.assertGreaterEqual(timings['used_size'], 0, 'A timing should not be negative')
+        disk.reset_timings()
+        self.assertEqual(disk.get_timings(), {}, 'Timings should be cleared after a reset')
 
     def test_volatiemutex(self):
         """
@@ -17,8 +17,12 @@
 """
 Basic test module
 """
+import time
 import unittest
+from contextlib import contextmanager
 from ovs.dal.helpers import Descriptor, HybridRunner
+from ovs.dal.hybrids.storagedriver import StorageDriver
+from ovs.dal.hybrids.storagerouter import StorageRouter
 from ovs.dal.relations import RelationMapper
 from ovs.dal.tests.helpers import DalHelper
 
@@ -30,6 +34,10 @@ class Hybrid(unittest.TestCase):
     that code actually works. This however means that all loaded 3rd party libs
     need to be mocked
     """
+    # Overlapping (nested) statistics of the StorageDrivers with id 1 and 2, as returned by fetch_statistics
+    DRIVER_STATISTICS = {'1': {'data_read': 1, 'read_distribution': {'4k': 1, '8k': 2}},
+                         '2': {'data_read': 2, 'read_distribution': {'8k': 3, '16k': 4}}}
+
     def setUp(self):
         """
         (Re)Sets the stores on every test
@@ -47,6 +55,20 @@ class Hybrid(unittest.TestCase):
         if self.debug is True:
             print message
 
+    @staticmethod
+    @contextmanager
+    def _patch_fetch_statistics(fetch_statistics):
+        """
+        Replaces StorageDriver.fetch_statistics for the duration of the context
+        :param fetch_statistics: Function returning the statistics of the StorageDriver it receives
+        """
+        original = StorageDriver.fetch_statistics
+        StorageDriver.fetch_statistics = fetch_statistics
+        try:
+            yield
+        finally:
+            StorageDriver.fetch_statistics = original
+
     def test_objectproperties(self):
         """
         Validates the correctness of all hybrid objects:
@@ -137,3 +159,80 @@ class Hybrid(unittest.TestCase):
             self.assertEqual(len(missing_metadata), 0,
                              'Missing metadata for properties in {0}: {1}'.format(cls.__name__, missing_metadata))
             instance.delete()
+
+    def test_vpool_statistics(self):
+        """
+        Validates the vPool statistics are fetched once from every StorageDriver, in order, that
+        their (nested) values are summed and that errors raised while fetching are passed on as-is
+        """
+        structure = DalHelper.build_dal_structure({'vpools': [1],
+                                                   'storagerouters': [1, 2],
+                                                   'storagedrivers': [(1, 1, 1), (2, 1, 2)]})  # (<id>, <vpool_id>, <storagerouter_id>)
+        vpool = structure['vpools'][1]
+        error = RuntimeError('Statistics unavailable')
+        fetched = []
+        failing = []
+
+        def _fetch_statistics(storagedriver):
+            fetched.append(storagedriver.guid)
+            if storagedriver.guid in failing:
+                raise error
+            return Hybrid.DRIVER_STATISTICS[storagedriver.storagedriver_id]
+
+        with Hybrid._patch_fetch_statistics(_fetch_statistics):
+            statistics = vpool.statistics
+            self.assertListEqual(fetched, [storagedriver.guid for storagedriver in vpool.storagedrivers])
+            self.assertEqual(statistics['data_read'], 3)
+            self.assertDictEqual(statistics['read_distribution'], {'4k': 1, '8k': 5, '16k': 4})
+
+            failing.append(structure['storagedrivers'][2].guid)
+            vpool.invalidate_dynamics('statistics')
+            with self.assertRaises(RuntimeError) as context:
+                _ = vpool.statistics
+            self.assertIs(context.exception, error)
+
+    def test_storagerouter_status(self):
+        """
+        Validates the StorageRouter status based on its heartbeats, disks and partitions
+        """
+        structure = DalHelper.build_dal_structure({'storagerouters': [1]})
+        storagerouter = structure['storagerouters'][1]
+        disk = storagerouter.disks[0]
+        partition = disk.partitions[0]
+
+        def _validate_status(heartbeats, expected_status):
+            storagerouter.heartbeats = heartbeats
+            storagerouter.save()
+            storagerouter.invalidate_dynamics('status')
+            self.assertEqual(storagerouter.status, expected_status)
+
+        current_time = time.time()
+        _validate_status({'process': current_time, 'celery': current_time}, 'OK')
+        _validate_status({'process': current_time, 'celery': current_time - StorageRouter.HEARTBEAT_WARNING_DELAY - 1}, 'WARNING')
+        _validate_status({'process': current_time, 'celery': current_time - StorageRouter.HEARTBEAT_FAILURE_DELAY - 1}, 'FAILURE')
+        _validate_status({'process': current_time - StorageRouter.HEARTBEAT_FAILURE_DELAY - 1, 'celery': current_time}, 'FAILURE')
+
+        disk.state = 'MISSING'
+        disk.save()
+        _validate_status({'process': current_time, 'celery': current_time}, 'FAILURE')
+        disk.state = 'OK'
+        disk.save()
+        partition.state = 'MISSING'
+        partition.save()
+        _validate_status({'process': current_time, 'celery': current_time}, 'FAILURE')
+        partition.state = 'OK'
+        partition.save()
+        _validate_status({'process': current_time, 'celery': current_time}, 'OK')
+
+    def test_storagerouter_statistics(self):
+        """
+        Validates the StorageRouter statistics sum the (nested) statistics of all its StorageDrivers
+        """
+        structure = DalHelper.build_dal_structure({'vpools': [1, 2],
+                                                   'storagerouters': [1],
+                                                   'storagedrivers': [(1, 1, 1), (2, 2, 1)]})  # (<id>, <vpool_id>, <storagerouter_id>)
+        storagerouter = structure['storagerouters'][1]
+        with Hybrid._patch_fetch_statistics(lambda storagedriver: Hybrid.DRIVER_STATISTICS[storagedriver.storagedriver_id]):
+            statistics = storagerouter.statistics
+        self.assertEqual(statistics['data_read'], 3)
+        self.assertDictEqual(statistics['read_distribution'], {'4k': 1, '8k': 5, '16k': 4})